@@ -0,0 +1,172 @@
+"""
+Local check of sharded crawling: several processes and a temporary shared directory
+stand in for separate nodes, and a stub client stands in for the YouTube API
+(no API key or quota needed).
+
+Run with: python examples_sharding.py
+"""
+import sys
+import tempfile
+from datetime import datetime
+from multiprocessing import Pool
+
+from youtube_data.models import Channel, PlaylistItem, Video
+from youtube_data.utils import ConsistentHashRing
+from youtube_data.automations import (
+    sharded_channel_ids_to_video_details,
+    merge_video_partitions,
+)
+
+VIDEOS_PER_CHANNEL = 3
+FAILING_CHANNEL_ID = "UCfailing"
+PUBLISHED_AT = datetime(2024, 1, 1)
+
+
+class StubYouTube:
+    """
+    Returns canned objects instead of calling the YouTube API.
+    Channel `UC...` has uploads playlist `UU...` with videos `<channel_id>-<n>`.
+    """
+
+    def get_channel_details(self, channel_ids: list[str]) -> list[Channel]:
+        return [
+            Channel(
+                channel_id=channel_id,
+                channel_title=channel_id,
+                description="",
+                custom_url="",
+                published_at=PUBLISHED_AT,
+                uploads_playlist_id="UU" + channel_id[2:],
+                view_count=0,
+                subscriber_count=0,
+                video_count=VIDEOS_PER_CHANNEL,
+            )
+            for channel_id in channel_ids
+        ]
+
+    def get_playlist_items(self, playlist_id: str, max_results: int = 50) -> list[PlaylistItem]:
+        channel_id = "UC" + playlist_id[2:]
+        return [
+            PlaylistItem(
+                playlist_id=playlist_id,
+                channel_id=channel_id,
+                video_id=f"{channel_id}-{n}",
+                position=n,
+            )
+            for n in range(min(VIDEOS_PER_CHANNEL, max_results))
+        ]
+
+    def get_video_details(self, video_ids: list[str]) -> list[Video]:
+        if any(video_id.startswith(FAILING_CHANNEL_ID) for video_id in video_ids):
+            raise RuntimeError("Quota exceeded")
+        return [
+            Video(
+                video_id=video_id,
+                title=video_id,
+                description="",
+                channel_id=video_id.rsplit("-", 1)[0],
+                channel_title="",
+                published_at=PUBLISHED_AT,
+                duration=60,
+                tags=[],
+                category_id=1,
+                view_count=0,
+                like_count=0,
+                dislike_count=0,
+                comment_count=0,
+            )
+            for video_id in video_ids
+        ]
+
+
+def check(condition: bool, message: str) -> None:
+    if not condition:
+        sys.exit(f"FAILED: {message}")
+
+
+def run_worker(args: tuple) -> bool:
+    channel_ids, workers, worker, output_dir = args
+    try:
+        sharded_channel_ids_to_video_details(
+            StubYouTube(), channel_ids, workers, worker, output_dir
+        )
+    except RuntimeError:
+        return False
+    return True
+
+
+def run_workers(channel_ids: list[str], workers: list[str], output_dir: str) -> list[bool]:
+    with Pool(len(workers)) as pool:
+        return pool.map(run_worker, [(channel_ids, workers, worker, output_dir) for worker in workers])
+
+
+def check_partition(channel_ids: list[str], workers: list[str]) -> None:
+    ring = ConsistentHashRing(workers)
+    assigned = [ring.filter_ids(channel_ids, worker) for worker in workers]
+    flat = [channel_id for ids in assigned for channel_id in ids]
+    check(len(flat) == len(set(flat)), "A channel was assigned to multiple workers")
+    check(set(flat) == set(channel_ids), "A channel was not assigned to any worker")
+
+
+def check_rebalance(channel_ids: list[str], workers: list[str], new_worker: str) -> float:
+    before = ConsistentHashRing(workers)
+    after = ConsistentHashRing(workers + [new_worker])
+    moved = [
+        channel_id for channel_id in channel_ids
+        if before.get_worker(channel_id) != after.get_worker(channel_id)
+    ]
+    check(
+        all(after.get_worker(channel_id) == new_worker for channel_id in moved),
+        "A channel moved between existing workers",
+    )
+    moved_share = len(moved) / len(channel_ids)
+    check(
+        moved_share <= 2 / (len(workers) + 1),
+        f"Adding a worker moved too many channels: {moved_share:.1%}",
+    )
+    return moved_share
+
+
+def check_crawl(channel_ids: list[str], workers: list[str]) -> None:
+    with tempfile.TemporaryDirectory() as output_dir:
+        # stale partition of a removed worker, must not be merged
+        with open(f"{output_dir}/videos-removed.jsonl", "w", encoding="utf-8") as f:
+            f.write(StubYouTube().get_video_details(["UCstale-0"])[0].model_dump_json() + "\n")
+
+        check(all(run_workers(channel_ids, workers, output_dir)), "A worker failed")
+        videos = merge_video_partitions(output_dir, channel_ids, workers)
+
+        video_ids = [video.video_id for video in videos]
+        expected = {f"{channel_id}-{n}" for channel_id in channel_ids for n in range(VIDEOS_PER_CHANNEL)}
+        check(len(video_ids) == len(set(video_ids)), "Duplicate videos after merge")
+        check(set(video_ids) == expected, "Merged videos do not match the input channels")
+
+        # partitions of another run (different channel list) must not be merged as this run
+        other_channel_ids = channel_ids[:-1]
+        check(all(run_workers(other_channel_ids, workers, output_dir)), "A worker failed")
+        try:
+            merge_video_partitions(output_dir, channel_ids, workers)
+            check(False, "Merge accepted partitions from a different run")
+        except ValueError:
+            pass
+
+        # a listed worker fails this run, its partition from the previous run must not be merged
+        failing_channel_ids = channel_ids + [FAILING_CHANNEL_ID]
+        results = run_workers(failing_channel_ids, workers, output_dir)
+        check(results.count(False) == 1, "Exactly one worker should fail")
+        try:
+            merge_video_partitions(output_dir, failing_channel_ids, workers)
+            check(False, "Merge accepted a run with a failed worker")
+        except FileNotFoundError:
+            pass
+
+
+if __name__ == "__main__":
+    channel_ids = [f"UC{i:022d}" for i in range(20000)]
+    workers = ["node-a", "node-b", "node-c"]
+
+    check_partition(channel_ids, workers)
+    moved = check_rebalance(channel_ids, workers, "node-d")
+    check_crawl(channel_ids[:500], workers)
+
+    print(f"OK: {len(workers)} -> {len(workers) + 1} workers moved {moved:.1%} of channels")
@@ -1,6 +1,9 @@
+import json
+import hashlib
+from pathlib import Path
 from .client import YouTube
 from .models import Channel, Video, VideoTranscript
-from .utils import create_chunks
+from .utils import create_chunks, ConsistentHashRing
 from .enums import SearchResourceTypeEnum   
 
 
@@ -116,3 +119,134 @@ def video_ids_to_transcripts(
     return transcripts
 
 
+PARTITION_INVALID_CHARS = set('<>:"/\\|?*')
+
+
+def _partition_path(output_dir: str | Path, worker: str) -> Path:
+    """
+    Returns the partition file path of a worker: `<output_dir>/videos-<worker>.jsonl`.
+    Worker names must be usable as file names on any platform.
+    """
+    invalid_chars = any(char in PARTITION_INVALID_CHARS or ord(char) < 32 for char in worker)
+    if not worker or worker.strip(" .") != worker or invalid_chars:
+        raise ValueError(f"Invalid worker name for a partition file: {worker!r}")
+    return Path(output_dir) / f"videos-{worker}.jsonl"
+
+
+def _partition_run_id(channel_ids: list[str], workers: list[str]) -> str:
+    """
+    Returns the id of a sharded run - a hash of the sorted workers and channel ids.
+    Partitions are stamped with it, so the merge can reject files of other runs.
+    """
+    run = json.dumps([sorted(set(workers)), sorted(set(channel_ids))])
+    return hashlib.sha256(run.encode("utf-8")).hexdigest()
+
+
+def sharded_channel_ids_to_video_details(
+    youtube: YouTube,
+    channel_ids: list[str],
+    workers: list[str],
+    worker: str,
+    output_dir: str | Path,
+    videos_per_channel: int = 50,
+    videos_per_request: int = 50,
+) -> list[Video]:
+    """
+    Sharded variant of channel_ids_to_video_details for running on multiple nodes.
+    Every worker receives the same full list of channel ids and workers, keeps only 
+    the channels assigned to it by consistent hashing, fetches their video details 
+    (uploads playlists and videos included) and writes its own partition file:
+    `<output_dir>/videos-<worker>.jsonl`. Use merge_video_partitions to combine them.
+
+    The worker's partition from a previous run is removed before crawling, so a 
+    worker that fails leaves no partition behind. The first line of a partition 
+    is a header with the run id, followed by one video per line.
+
+    Args:
+        youtube: YouTube: The YouTube object.
+        channel_ids: list[str]: The full list of channel ids (same on every worker).
+        workers: list[str]: The names of all workers (same on every worker).
+        worker: str: The name of the current worker.
+        output_dir: str | Path: The shared directory for partition files.
+        videos_per_channel: int: The number of videos to get per channel.
+        videos_per_request: int: The number of videos to get per request.
+
+    Returns:
+        list[Video]: The list of video details fetched by this worker.
+    """
+    partition_path = _partition_path(output_dir, worker)
+    tmp_path = partition_path.with_suffix(".jsonl.tmp")
+    ring = ConsistentHashRing(workers)
+    worker_channel_ids = ring.filter_ids(list(dict.fromkeys(channel_ids)), worker)
+
+    partition_path.parent.mkdir(parents=True, exist_ok=True)
+    partition_path.unlink(missing_ok=True)
+    tmp_path.unlink(missing_ok=True)
+
+    videos = []
+    if worker_channel_ids:
+        videos = channel_ids_to_video_details(
+            youtube, worker_channel_ids, videos_per_channel, videos_per_request
+        )
+
+    header = {"run_id": _partition_run_id(channel_ids, workers), "worker": worker}
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(header) + "\n")
+        for video in videos:
+            f.write(video.model_dump_json() + "\n")
+    tmp_path.replace(partition_path)
+
+    return videos
+
+
+def merge_video_partitions(
+    output_dir: str | Path,
+    channel_ids: list[str],
+    workers: list[str],
+    merged_path: str | Path | None = None,
+) -> list[Video]:
+    """
+    Combines the partition files written by sharded_channel_ids_to_video_details.
+    Only `videos-<worker>.jsonl` of the given workers is read, and every partition 
+    must be stamped with the run id of the given channel ids and workers, so files 
+    of removed workers or of earlier runs are never merged. Videos are deduplicated 
+    by video id (first occurrence wins, in the order of workers).
+
+    Args:
+        output_dir: str | Path: The shared directory containing partition files.
+        channel_ids: list[str]: The full list of channel ids of the current run.
+        workers: list[str]: The names of all workers of the current run.
+        merged_path: str | Path | None: Optional path to write the merged jsonl file.
+
+    Returns:
+        list[Video]: The merged list of video details.
+
+    Raises:
+        FileNotFoundError: If a partition of any of the workers is missing.
+        ValueError: If a partition belongs to a different run.
+    """
+    run_id = _partition_run_id(channel_ids, workers)
+    partition_paths = [_partition_path(output_dir, worker) for worker in workers]
+    missing = [str(path) for path in partition_paths if not path.is_file()]
+    if missing:
+        raise FileNotFoundError(f"Missing worker partitions: {', '.join(missing)}")
+
+    videos = {}
+    for partition_path in partition_paths:
+        with open(partition_path, encoding="utf-8") as f:
+            header = json.loads(f.readline() or "{}")
+            if header.get("run_id") != run_id:
+                raise ValueError(f"Partition from a different run: {partition_path}")
+            for line in f:
+                if not line.strip():
+                    continue
+                video = Video.model_validate_json(line)
+                videos.setdefault(video.video_id, video)
+
+    merged = list(videos.values())
+    if merged_path is not None:
+        with open(merged_path, "w", encoding="utf-8") as f:
+            for video in merged:
+                f.write(video.model_dump_json() + "\n")
+
+    return merged
@@ -1,4 +1,6 @@
 import re
+import bisect
+import hashlib
 from datetime import datetime
 from .models import Video, Channel, PlaylistItem, SearchItem
 
@@ -125,3 +127,51 @@ def create_chunks(lst, n):
     for i in range(0, len(lst), n):
         chunks.append(lst[i:i+n])
     return chunks
+
+
+class ConsistentHashRing:
+    """
+    Assigns object ids (e.g. channel ids) to a set of workers by consistent hashing.
+    Each worker is placed on the ring multiple times (virtual nodes), so adding or
+    removing a worker only moves the ids that fall between its ring positions.
+
+    Args:
+        workers: list[str]: The names of the workers.
+        replicas: int: The number of virtual nodes per worker.
+    """
+
+    def __init__(self, workers: list[str], replicas: int = 100):
+        if not workers:
+            raise ValueError("At least one worker is required")
+        if len(set(workers)) != len(workers):
+            raise ValueError("Worker names must be unique")
+        if replicas < 1:
+            raise ValueError("`replicas` must be greater than or equal to 1")
+
+        self.workers = list(workers)
+        self.replicas = replicas
+        self._ring = sorted(
+            (self._hash(f"{worker}#{i}"), worker)
+            for worker in self.workers
+            for i in range(replicas)
+        )
+        self._keys = [key for key, _ in self._ring]
+
+    @staticmethod
+    def _hash(value: str) -> int:
+        return int(hashlib.md5(value.encode("utf-8")).hexdigest(), 16)
+
+    def get_worker(self, object_id: str) -> str:
+        """
+        Returns the worker responsible for a given object id.
+        """
+        index = bisect.bisect(self._keys, self._hash(object_id)) % len(self._keys)
+        return self._ring[index][1]
+
+    def filter_ids(self, object_ids: list[str], worker: str) -> list[str]:
+        """
+        Returns the object ids assigned to a given worker (order is preserved).
+        """
+        if worker not in self.workers:
+            raise ValueError(f"Unknown worker: {worker}")
+        return [object_id for object_id in object_ids if self.get_worker(object_id) == worker]